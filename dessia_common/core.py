@@ -9,8 +9,9 @@ import warnings
 import tempfile
 import math
 import random
+import statistics
 import copy
-from functools import reduce
+from functools import reduce, lru_cache
 import collections
 from copy import deepcopy
 import inspect
@@ -32,11 +33,19 @@ from dessia_common.typings import Measure, JsonSerializable,\
 from importlib import import_module
 
 
-JSONSCHEMA_HEADER = {"definitions": {},
-                     "$schema": "http://json-schema.org/draft-07/schema#",
-                     "type": "object",
-                     "required": [],
-                     "properties": {}}
+def jsonschema_header():
+    """
+    Returns a fresh jsonschema header dict. Building the two-level
+    structure directly is much cheaper than deep-copying a template
+    """
+    return {"definitions": {},
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "object",
+            "required": [],
+            "properties": {}}
+
+
+JSONSCHEMA_HEADER = jsonschema_header()
 
 TYPING_EQUIVALENCES = {int: 'number', float: 'number',
                        bool: 'boolean', str: 'string'}
@@ -46,11 +55,20 @@ TYPES_STRINGS = {int: 'int', float: 'float', bool: 'boolean', str: 'str',
 
 SEQUENCE_TYPINGS = ['List', 'Sequence', 'Iterable']
 
-_FORBIDDEN_ARGNAMES = ['self', 'cls', 'progress_callback', 'return']
+_FORBIDDEN_ARGNAMES = frozenset(['self', 'cls', 'progress_callback',
+                                 'return'])
 
 TYPES_FROM_STRING = {'unicode': str, 'str': str, 'float': float,
                      'int': int, 'bool': bool}
 
+_CLASS_JSONSCHEMA_CACHE = {}
+
+_BASE_DICT_TEMPLATE_CACHE = {}
+
+_FULL_CLASSNAME_CACHE = {}
+
+_PYTHON_CLASS_CACHE = {}
+
 
 class ExceptionWithTraceback(Exception):
     def __init__(self, message, traceback_=''):
@@ -99,13 +117,29 @@ def deprecated(use_instead=None):
     return decorated
 
 
+# Full argspecs are expensive to build and only depend on the function
+# or class they are computed from, so memoize them. The cache is bounded
+# because the platform generates methods dynamically
+_cached_fullargspec = lru_cache(maxsize=2048)(inspect.getfullargspec)
+
+
+# Names for which a deprecation warning was already emitted.
+# warnings.warn walks frames and filters on every call, which is far too
+# expensive for warnings sitting on serialization hot paths.
+# DeprecationWarning is ignored by default outside __main__, so install
+# the 'once' filter here instead of before each warn call
+warnings.simplefilter('once', DeprecationWarning)
+_EMITTED_DEPRECATION_WARNINGS = set()
+
+
 def deprecation_warning(name, object_type, use_instead=None):
-    warnings.simplefilter('once', DeprecationWarning)
     msg = "\n\n{} {} is deprecated.\n".format(object_type, name)
     msg += "It will be removed in a future version.\n"
     if use_instead is not None:
         msg += "Use {} instead.\n".format(use_instead)
-    warnings.warn(msg, DeprecationWarning)
+    if name not in _EMITTED_DEPRECATION_WARNINGS:
+        _EMITTED_DEPRECATION_WARNINGS.add(name)
+        warnings.warn(msg, DeprecationWarning)
     return msg
 
 
@@ -179,6 +213,8 @@ class DessiaObject:
             return object.__hash__(self)
 
     def __eq__(self, other_object):
+        if self is other_object:
+            return True
         if self._eq_is_data_eq:
             if self.__class__.__name__ != other_object.__class__.__name__:
                 return False
@@ -187,21 +223,57 @@ class DessiaObject:
             return self._data_eq(other_object)
         return object.__eq__(self, other_object)
 
-    def _data_eq(self, other_object):
+    def _data_eq(self, other_object, memo=None):
+        if self is other_object:
+            return True
         if full_classname(self) != full_classname(other_object):
             return False
 
-        eq_dict = self._serializable_dict()
-        if 'name' in eq_dict:
-            del eq_dict['name']
-            
-        other_eq_dict = other_object._serializable_dict()
+        if memo is None:
+            # Memo of already compared object pairs, keyed by identity.
+            # Objects shared across several attributes (DAG-shaped models)
+            # are then only deep-compared once
+            memo = {}
 
-        for key, value in eq_dict.items():
-            other_value = other_eq_dict[key]
-            if value != other_value:
+        # Walk __dict__ directly instead of materializing both
+        # _serializable_dict results, so a mismatch on the first
+        # attribute costs nothing in allocations
+        non_serializable = self._non_serializable_attributes
+        dict_ = self.__dict__
+        other_dict = other_object.__dict__
+
+        ncompared = 0
+        for key, value in dict_.items():
+            if key == 'name' or key.startswith('_') \
+                    or key in non_serializable:
+                continue
+            if key not in other_dict:
                 return False
-        return True
+            ncompared += 1
+            other_value = other_dict[key]
+            if value is other_value:
+                continue
+            if (isinstance(value, DessiaObject)
+                    and isinstance(other_value, DessiaObject)
+                    and value._eq_is_data_eq
+                    and type(value)._data_eq is DessiaObject._data_eq):
+                pair = (id(value), id(other_value))
+                result = memo.get(pair)
+                if result is None:
+                    result = value._data_eq(other_value, memo)
+                    memo[pair] = result
+                if not result:
+                    return False
+            elif value != other_value:
+                return False
+
+        # The other object must not carry extra comparable attributes
+        for key in other_dict:
+            if key == 'name' or key.startswith('_') \
+                    or key in non_serializable:
+                continue
+            ncompared -= 1
+        return ncompared == 0
 
     def _data_hash(self):
         hash_ = 0
@@ -227,6 +299,9 @@ class DessiaObject:
         """
         missing_keys_in_other_object = []
         diff_values = {}
+
+        if self is other_object:
+            return diff_values, missing_keys_in_other_object
         
         # eq_dict = {k: v for k, v in self.to_dict().items()
         #            if (k not in ['package_version', 'name'])\
@@ -235,14 +310,18 @@ class DessiaObject:
         # other_eq_dict = other_object.to_dict()
         other_eq_dict = other_object._serializable_dict()
 
+        # Partition keys once with C-level set operations; the common
+        # case of identical key sets skips per-key membership tests
+        missing = eq_dict.keys() - other_eq_dict.keys()
+        missing_keys_in_other_object.extend(missing)
+
         for key, value in eq_dict.items():
-            if key not in other_eq_dict:
-                missing_keys_in_other_object.append(key)
-            else:                
-                other_value = other_eq_dict[key]
-                if value != other_value:
-                    diff_values[key] = (value, other_value)
-                
+            if key in missing:
+                continue
+            other_value = other_eq_dict[key]
+            if value != other_value:
+                diff_values[key] = (value, other_value)
+
         return diff_values, missing_keys_in_other_object
 
     @property
@@ -250,20 +329,27 @@ class DessiaObject:
         return full_classname(self)
 
     def base_dict(self):
-        package_name = self.__module__.split('.')[0]
-        if package_name in sys.modules:
-            package = sys.modules[package_name]
-            if hasattr(package, '__version__'):
-                package_version = package.__version__
+        class_ = self.__class__
+        template = _BASE_DICT_TEMPLATE_CACHE.get(class_)
+        if template is None:
+            package_name = self.__module__.split('.')[0]
+            if package_name in sys.modules:
+                package = sys.modules[package_name]
+                if hasattr(package, '__version__'):
+                    package_version = package.__version__
+                else:
+                    package_version = None
             else:
                 package_version = None
-        else:
-            package_version = None
 
-        object_class = self.__module__ + '.' + self.__class__.__name__
-        dict_ = {'name': self.name, 'object_class': object_class}
-        if package_version:
-            dict_['package_version'] = package_version
+            object_class = self.__module__ + '.' + class_.__name__
+            template = {'object_class': object_class}
+            if package_version:
+                template['package_version'] = package_version
+            _BASE_DICT_TEMPLATE_CACHE[class_] = template
+
+        dict_ = {'name': self.name}
+        dict_.update(template)
         return dict_
 
     def _serializable_dict(self):
@@ -318,7 +404,7 @@ class DessiaObject:
 
     @classmethod
     def base_jsonschema(cls):
-        jsonschema = deepcopy(JSONSCHEMA_HEADER)
+        jsonschema = jsonschema_header()
         jsonschema['properties']['name'] = {
             'type': 'string',
             "title": "Object Name",
@@ -334,6 +420,9 @@ class DessiaObject:
             _jsonschema = cls._jsonschema
             return _jsonschema
 
+        if cls in _CLASS_JSONSCHEMA_CACHE:
+            return _CLASS_JSONSCHEMA_CACHE[cls]
+
         # Get __init__ method and its annotations
         init = cls.__init__
         if cls._init_variables is None:
@@ -360,7 +449,7 @@ class DessiaObject:
         parsed_attributes = parsed_docstring['attributes']
 
         # Initialize jsonschema
-        _jsonschema = deepcopy(JSONSCHEMA_HEADER)
+        _jsonschema = jsonschema_header()
 
         required_arguments, default_arguments = inspect_arguments(method=init,
                                                                   merge=False)
@@ -402,6 +491,7 @@ class DessiaObject:
 
         _jsonschema['classes'] = [cls.__module__ + '.' + cls.__name__]
         _jsonschema['whitelist_attributes'] = cls._whitelist_attributes
+        _CLASS_JSONSCHEMA_CACHE[cls] = _jsonschema
         return _jsonschema
 
     @property
@@ -430,7 +520,7 @@ class DessiaObject:
                                                                 merge=False)
                 annotations = get_type_hints(method)
                 if annotations:
-                    jsonschemas[method_name] = deepcopy(JSONSCHEMA_HEADER)
+                    jsonschemas[method_name] = jsonschema_header()
                     jsonschemas[method_name]['required'] = []
                     jsonschemas[method_name]['method'] = True
                     for i, annotation in enumerate(annotations.items()):
@@ -467,8 +557,10 @@ class DessiaObject:
         return dict_
 
     def dict_to_arguments(self, dict_, method):
-        method_object = getattr(self, method)
-        args_specs = inspect.getfullargspec(method_object)
+        # Lookup on the class so the argspec cache is keyed per method,
+        # not per bound instance
+        method_object = getattr(self.__class__, method)
+        args_specs = _cached_fullargspec(method_object)
         allowed_args = args_specs.args[1:]
 
         arguments = {}
@@ -520,7 +612,7 @@ class DessiaObject:
         """
         Generic copy use inits of objects
         """
-        class_argspec = inspect.getfullargspec(self.__class__)
+        class_argspec = _cached_fullargspec(self.__class__)
         dict_ = {}
         for arg in class_argspec.args:
             if arg != 'self':
@@ -536,7 +628,7 @@ class DessiaObject:
         """
         Generic deep copy use inits of objects
         """
-        class_argspec = inspect.getfullargspec(self.__class__)
+        class_argspec = _cached_fullargspec(self.__class__)
         if memo is None:
             memo = {}
         dict_ = {}
@@ -643,8 +735,11 @@ class DessiaObject:
         """
         Reproduce lifecycle on platform (serialization, display)
         """
-        self.dict_to_object(json.loads(json.dumps(self.to_dict())))
-        bson.BSON.encode(self.to_dict())
+        # to_dict is the expensive step: compute it once and feed both
+        # the json round-trip and the bson encoding from it
+        dict_ = self.to_dict()
+        self.dict_to_object(json.loads(json.dumps(dict_)))
+        bson.BSON.encode(dict_)
         json.dumps(self._displays())
 
     
@@ -738,7 +833,9 @@ class ParameterSet(DessiaObject):
 
     @property
     def means(self):
-        means = {k: sum(v)/len(v) for k, v in self.values.items()}
+        # fmean runs in C in a single pass and does not accumulate
+        # float rounding errors like sum()/len()
+        means = {k: statistics.fmean(v) for k, v in self.values.items()}
         return means
 
 
@@ -826,11 +923,13 @@ class CombinationEvolution(DessiaObject):
         self.x_, self.y_ = self.genere_xy()
 
     def genere_xy(self):
+        # extend is linear in the appended length, while x = x + ...
+        # recopied the whole accumulated list at every step
         x, y = [], []
         for evol in self.evolution1:
-            x = x + evol.evolution
+            x.extend(evol.evolution)
         for evol in self.evolution2:
-            y = y + evol.evolution
+            y.extend(evol.evolution)
         return x, y
 
 
@@ -842,9 +941,10 @@ def number2factor(number):
     factor_range = range(1, int(number ** 0.5) + 1)
 
     if number:
-        factors = list(set(reduce(list.__add__, ([i, number // i]
-                                                 for i in factor_range
-                                                 if number % i == 0))))
+        # Building the set directly avoids the quadratic list
+        # concatenations of reduce(list.__add__, ...)
+        factors = list({factor for i in factor_range if number % i == 0
+                        for factor in (i, number // i)})
 
         grids = [(factor_x, int(number / factor_x))
                  for factor_x in factors
@@ -862,9 +962,8 @@ def number3factor(number, complete=True):
     factor_range = range(1, int(number ** 0.5) + 1)
 
     if number:
-        factors = list(set(reduce(list.__add__, ([i, number // i]
-                                                 for i in factor_range
-                                                 if number % i == 0))))
+        factors = list({factor for i in factor_range if number % i == 0
+                        for factor in (i, number // i)})
         if not complete:
             grids = get_incomplete_factors(number, factors)
 
@@ -958,10 +1057,25 @@ def stringify_dict_keys(obj):
     return new_obj
 
 
+# Exact types resolved with a single hash probe on the serialization
+# hot path; subclasses still go through the generic checks below
+_JSON_BASE_TYPES = frozenset([str, int, float, bool, type(None)])
+
+# Bound once at import: avoids two attribute lookups per is_sequence call
+_SEQUENCE_ABC = collections.abc.Sequence
+
+
 def serialize_dict(dict_):
     serialized_dict = {}
     for key, value in dict_.items():
-        if hasattr(value, 'to_dict'):
+        value_type = type(value)
+        if value_type in _JSON_BASE_TYPES:
+            serialized_value = value
+        elif value_type is dict:
+            serialized_value = serialize_dict(value)
+        elif value_type is list or value_type is tuple:
+            serialized_value = serialize_sequence(value)
+        elif hasattr(value, 'to_dict'):
             serialized_value = value.to_dict()
         elif isinstance(value, dict):
             serialized_value = serialize_dict(value)
@@ -979,7 +1093,14 @@ def serialize_dict(dict_):
 def serialize_sequence(seq):
     serialized_sequence = []
     for value in seq:
-        if hasattr(value, 'to_dict'):
+        value_type = type(value)
+        if value_type in _JSON_BASE_TYPES:
+            serialized_sequence.append(value)
+        elif value_type is dict:
+            serialized_sequence.append(serialize_dict(value))
+        elif value_type is list or value_type is tuple:
+            serialized_sequence.append(serialize_sequence(value))
+        elif hasattr(value, 'to_dict'):
             serialized_sequence.append(value.to_dict())
         elif isinstance(value, dict):
             serialized_sequence.append(serialize_dict(value))
@@ -991,9 +1112,14 @@ def serialize_sequence(seq):
 
 
 def get_python_class_from_class_name(full_class_name):
-    module_name, class_name = full_class_name.rsplit('.', 1)
-    module = import_module(module_name)
-    class_ = getattr(module, class_name)
+    # Single dict probe on the hot deserialization path; import and
+    # attribute lookup only run once per class name
+    class_ = _PYTHON_CLASS_CACHE.get(full_class_name)
+    if class_ is None:
+        module_name, class_name = full_class_name.rsplit('.', 1)
+        module = import_module(module_name)
+        class_ = getattr(module, class_name)
+        _PYTHON_CLASS_CACHE[full_class_name] = class_
     return class_
 
 
@@ -1010,7 +1136,7 @@ def dict_to_object(dict_, class_=None, force_generic: bool = False):
             return obj
 
         if class_._init_variables is None:
-            class_argspec = inspect.getfullargspec(class_)
+            class_argspec = _cached_fullargspec(class_)
             init_dict = {k: v for k, v in working_dict.items()
                          if k in class_argspec.args}
         else:
@@ -1036,30 +1162,41 @@ def dict_to_object(dict_, class_=None, force_generic: bool = False):
     return obj
 
 
-def list_hash(list_):
+def _structure_hash(list_elements, dict_items):
+    # Iterative traversal with explicit stacks: the hash is a plain sum,
+    # so traversal order is irrelevant and deep structures cannot hit
+    # the recursion limit
     hash_ = 0
-    for element in list_:
-        if isinstance(element, list):
-            hash_ += list_hash(element)
-        elif isinstance(element, dict):
-            hash_ += dict_hash(element)
-        elif isinstance(element, str):
-            hash_ += sum([ord(e) for e in element])
+    element_stack = list(list_elements)
+    item_stack = list(dict_items)
+    while element_stack or item_stack:
+        if element_stack:
+            element = element_stack.pop()
+            if isinstance(element, list):
+                element_stack.extend(element)
+            elif isinstance(element, dict):
+                item_stack.extend(element.items())
+            elif isinstance(element, str):
+                hash_ += sum([ord(e) for e in element])
+            else:
+                hash_ += hash(element)
         else:
-            hash_ += hash(element)
+            key, value = item_stack.pop()
+            if isinstance(value, list):
+                element_stack.extend(value)
+            elif isinstance(value, dict):
+                item_stack.extend(value.items())
+            else:
+                hash_ += hash(key) + hash(value)
     return hash_
 
 
+def list_hash(list_):
+    return _structure_hash(list_, ())
+
+
 def dict_hash(dict_):
-    hash_ = 0
-    for key, value in dict_.items():
-        if isinstance(value, list):
-            hash_ += list_hash(value)
-        elif isinstance(value, dict):
-            hash_ += dict_hash(value)
-        else:
-            hash_ += hash(key) + hash(value)
-    return hash_
+    return _structure_hash((), dict_.items())
 
 
 def sequence_to_objects(sequence):
@@ -1081,13 +1218,21 @@ def getdeepattr(obj, attr):
 
 def full_classname(object_, compute_for: str = 'instance'):
     if compute_for == 'instance':
-        return object_.__class__.__module__ + '.' + object_.__class__.__name__
+        class_ = object_.__class__
     elif compute_for == 'class':
-        return object_.__module__ + '.' + object_.__name__
+        class_ = object_
     else:
         msg = 'Cannot compute {} full classname for object {}'
         raise NotImplementedError(msg.format(compute_for, object_))
 
+    # Classes are long-lived, so caching per class is bounded and spares
+    # rebuilding the same string on every equality check
+    classname = _FULL_CLASSNAME_CACHE.get(class_)
+    if classname is None:
+        classname = class_.__module__ + '.' + class_.__name__
+        _FULL_CLASSNAME_CACHE[class_] = classname
+    return classname
+
 
 def serialization_test(obj):
     # TODO: debug infinite recursion? Should we remove thhis ?
@@ -1335,12 +1480,14 @@ def concatenate_attributes(prefix, suffix, type_: str = 'str'):
 
 
 def deepattr_to_sequence(deepattr: str):
-    sequence = deepattr.split('/')
+    # Testing for digits is much cheaper than raising ValueError for
+    # every non-index part of the path
     healed_sequence = []
-    for i, attribute in enumerate(sequence):
-        try:
+    for attribute in deepattr.split('/'):
+        if attribute.isdigit()\
+                or (attribute[:1] == '-' and attribute[1:].isdigit()):
             healed_sequence.append(int(attribute))
-        except ValueError:
+        else:
             healed_sequence.append(attribute)
     return healed_sequence
 
@@ -1352,23 +1499,20 @@ def sequence_to_deepattr(sequence):
 
 
 def is_bounded(filter_: Filter, value: float):
-    bounded = True
     operator = filter_['operator']
     bound = filter_['bound']
 
-    if operator == 'lte' and value > bound:
-        bounded = False
-    if operator == 'gte' and value < bound:
-        bounded = False
-
-    if operator == 'lt' and value >= bound:
-        bounded = False
-    if operator == 'gt' and value <= bound:
-        bounded = False
-
-    if operator == 'eq' and value != bound:
-        bounded = False
-    return bounded
+    if operator == 'lte':
+        return value <= bound
+    if operator == 'gte':
+        return value >= bound
+    if operator == 'lt':
+        return value < bound
+    if operator == 'gt':
+        return value > bound
+    if operator == 'eq':
+        return value == bound
+    return True
 
 
 def is_sequence(obj):
@@ -1377,8 +1521,10 @@ def is_sequence(obj):
     :return: bool. True if object is a sequence but not a string.
                    False otherwise
     """
-    return isinstance(obj, collections.abc.Sequence)\
-        and not isinstance(obj, str)
+    type_ = type(obj)
+    if type_ is list or type_ is tuple:
+        return True
+    return isinstance(obj, _SEQUENCE_ABC) and not isinstance(obj, str)
 
 
 def is_builtin(type_):
@@ -1400,14 +1546,13 @@ def type_from_annotation(type_, module):
 
 
 def is_typing(object_: Any):
-    has_module = hasattr(object_, '__module__')
-    if has_module:
-        in_typings = object_.__module__ in ['typing', 'dessia_common.typings']
-    else:
+    # Fail fast: each check only makes sense if the previous one passed
+    module = getattr(object_, '__module__', None)
+    if module not in ('typing', 'dessia_common.typings'):
         return False
-    has_origin = hasattr(object_, '__origin__')
-    has_args = hasattr(object_, '__args__')
-    return has_module and has_origin and has_args and in_typings
+    if not hasattr(object_, '__origin__'):
+        return False
+    return hasattr(object_, '__args__')
 
 
 def jsonschema_from_annotation(annotation, jsonschema_element,
@@ -1486,12 +1631,15 @@ def jsonschema_from_annotation(annotation, jsonschema_element,
                 }
             })
         elif origin is Subclass:
-            warnings.simplefilter('once', DeprecationWarning)
-            msg = "\n\nTyping of attribute '{0}' from class {1} "\
-                  "uses Subclass which is deprecated."\
-                  "\n\nUse 'InstanceOf[{2}]' instead of 'Subclass[{2}]'.\n"
-            arg = args[0].__name__
-            warnings.warn(msg.format(key, args[0], arg), DeprecationWarning)
+            warning_key = 'Subclass:' + key
+            if warning_key not in _EMITTED_DEPRECATION_WARNINGS:
+                _EMITTED_DEPRECATION_WARNINGS.add(warning_key)
+                msg = "\n\nTyping of attribute '{0}' from class {1} "\
+                      "uses Subclass which is deprecated."\
+                      "\n\nUse 'InstanceOf[{2}]' instead of 'Subclass[{2}]'.\n"
+                arg = args[0].__name__
+                warnings.warn(msg.format(key, args[0], arg),
+                              DeprecationWarning)
             # Several possible classes that are subclass of another one
             class_ = args[0]
             classname = full_classname(object_=class_, compute_for='class')
@@ -1585,14 +1733,16 @@ def prettyname(namestr):
 
 
 def static_dict_jsonschema(typed_dict, title=None):
-    warnings.simplefilter('once', DeprecationWarning)
-    msg = "\n\nStatic Dict typing is not fully supported.\n" \
-          "This will most likely lead to non predictable behavior" \
-          " or malfunctionning features. \n" \
-          "Define a custom non-standalone class for type '{}'\n\n"
     classname = full_classname(typed_dict, compute_for='class')
-    warnings.warn(msg.format(classname), DeprecationWarning)
-    jsonschema_element = deepcopy(JSONSCHEMA_HEADER)
+    warning_key = 'StaticDict:' + classname
+    if warning_key not in _EMITTED_DEPRECATION_WARNINGS:
+        _EMITTED_DEPRECATION_WARNINGS.add(warning_key)
+        msg = "\n\nStatic Dict typing is not fully supported.\n" \
+              "This will most likely lead to non predictable behavior" \
+              " or malfunctionning features. \n" \
+              "Define a custom non-standalone class for type '{}'\n\n"
+        warnings.warn(msg.format(classname), DeprecationWarning)
+    jsonschema_element = jsonschema_header()
     jss_properties = jsonschema_element['properties']
 
     # Every value is required in a StaticDict
@@ -1653,21 +1803,20 @@ def set_default_value(jsonschema_element, key, default_value):
 
 def inspect_arguments(method, merge=False):
     # Find default value and required arguments of class construction
-    args_specs = inspect.getfullargspec(method)
-    nargs = len(args_specs.args) - 1
-
-    if args_specs.defaults is not None:
-        ndefault_args = len(args_specs.defaults)
-    else:
-        ndefault_args = 0
+    # Reading the code object directly is much cheaper than
+    # inspect.getfullargspec, which builds a full Signature object
+    code = method.__code__
+    argnames = code.co_varnames[1:code.co_argcount]
+    defaults = method.__defaults__ or ()
+    nargs = len(argnames)
+    ndefault_args = len(defaults)
 
     default_arguments = {}
     arguments = []
-    for iargument, argument in enumerate(args_specs.args[1:]):
+    for iargument, argument in enumerate(argnames):
         if argument not in _FORBIDDEN_ARGNAMES:
             if iargument >= nargs - ndefault_args:
-                default_value = args_specs.defaults[ndefault_args - nargs
-                                                    + iargument]
+                default_value = defaults[ndefault_args - nargs + iargument]
                 if merge:
                     arguments.append((argument, default_value))
                 else:
@@ -161,6 +161,7 @@ class XLSXWriter:
         
         self.classes_to_sheets = {}
         self.object_to_sheet_row = {}
+        self._attribute_names_cache = {}
         for class_name, obj_paths in self.paths.items():
             sheet = self.workbook.create_sheet(class_name)
             self.classes_to_sheets[class_name] = sheet
@@ -171,6 +172,20 @@ class XLSXWriter:
         
         self.write()
 
+    def _sorted_attribute_names(self, obj):
+        # Rows of a sheet all hold instances of the same class, so the
+        # sorted public attribute list is cached per class instead of
+        # re-sorting __dict__ for every row
+        class_ = obj.__class__
+        keys = obj.__dict__.keys()
+        entry = self._attribute_names_cache.get(class_)
+        if entry is None or entry[0] != keys:
+            names = [k for k in sorted(keys)
+                     if (not k.startswith('_')) and k != 'name']
+            entry = (set(keys), names)
+            self._attribute_names_cache[class_] = entry
+        return entry[1]
+
     def write_class_header_to_row(self, obj_of_class, sheet, row_number, path=''):
         cell = sheet.cell(row=row_number, column=1, value='Path')
         cell.fill = self.pattern_color2
@@ -183,14 +198,13 @@ class XLSXWriter:
         cell.font = self.white_font
         i = 3
         
-        for (k, _) in sorted(obj_of_class.__dict__.items()):
-            if (not k.startswith('_')) and k != 'name':
-                cell = sheet.cell(row=row_number, column=i, value=str(k))
-
-                cell.border = self.thin_border
-                cell.fill = self.pattern_color2
-                cell.font = self.white_font
-                i += 1
+        for k in self._sorted_attribute_names(obj_of_class):
+            cell = sheet.cell(row=row_number, column=i, value=str(k))
+
+            cell.border = self.thin_border
+            cell.fill = self.pattern_color2
+            cell.font = self.white_font
+            i += 1
                 
                 
     def write_object_to_row(self, obj, sheet, row_number, path=''):
@@ -202,35 +216,35 @@ class XLSXWriter:
             cell = sheet.cell(row=row_number, column=2, value='No name in model')
         cell.border = self.thin_border
         i = 3
-        for (k, v) in sorted(obj.__dict__.items()):
-            if (not k.startswith('_')) and k != 'name':
-                cell_link = None
-                if isinstance(v, dict):
-                    str_v = 'Dict of {} items'.format(len(v))
-                elif isinstance(v, list):
-                    if is_builtins_list(v):
-                        str_v = str(v)
-                    else:                           
-                        str_v = 'List of {} items'.format(len(v))
-                            
-                elif isinstance(v, set):
-                    str_v = 'Set of {} items'.format(len(v))
-                elif isinstance(v, float):
-                    str_v = round(v, 6)
-                elif is_hashable(v) and v in self.object_to_sheet_row:
-                    ref_sheet, ref_row_number, ref_path = self.object_to_sheet_row[v]
-                    str_v = ref_path
-                    cell_link = '#{}!A{}'.format(ref_sheet.title, ref_row_number)
-                else:
+        for k in self._sorted_attribute_names(obj):
+            v = obj.__dict__[k]
+            cell_link = None
+            if isinstance(v, dict):
+                str_v = 'Dict of {} items'.format(len(v))
+            elif isinstance(v, list):
+                if is_builtins_list(v):
                     str_v = str(v)
-                
-                cell = sheet.cell(row=row_number, column=i, value=str_v)
-                if cell_link:
-                    cell.hyperlink = cell_link
+                else:
+                    str_v = 'List of {} items'.format(len(v))
+
+            elif isinstance(v, set):
+                str_v = 'Set of {} items'.format(len(v))
+            elif isinstance(v, float):
+                str_v = round(v, 6)
+            elif is_hashable(v) and v in self.object_to_sheet_row:
+                ref_sheet, ref_row_number, ref_path = self.object_to_sheet_row[v]
+                str_v = ref_path
+                cell_link = '#{}!A{}'.format(ref_sheet.title, ref_row_number)
+            else:
+                str_v = str(v)
 
-                cell.border = self.thin_border
-                
-                i += 1
+            cell = sheet.cell(row=row_number, column=i, value=str_v)
+            if cell_link:
+                cell.hyperlink = cell_link
+
+            cell.border = self.thin_border
+
+            i += 1
 
                 # column_width = min((len(k) + 1.5), max_column_width)
                 # column_name = openpyxl.utils.cell.get_column_letter(i)
@@ -489,8 +489,8 @@ class Generator(DessiaObject):
     def generate(self) -> List[StandaloneObject]:
         # submodels = [Submodel(self.parameter * i)
         #              for i in range(self.nb_solutions)]
-        self.models = [StandaloneObject.generate(self.parameter + i)
-                       for i in range(self.nb_solutions)]
+        seeds = range(self.parameter, self.parameter + self.nb_solutions)
+        self.models = [StandaloneObject.generate(seed) for seed in seeds]
         return self.models
 
 
@@ -2,12 +2,13 @@ from dessia_common.workflow import InstantiateModel, ModelMethod,\
     ModelAttribute, Pipe, Workflow, WorkflowBlock, ForEach, MultiPlot
 from dessia_common.forms import Generator, Optimizer
 from dessia_common import MethodType
+import json
 
 instanciate_generator = InstantiateModel(model_class=Generator,
                                          name='Instantiate Generator')
 
 generate_method = MethodType(class_=Generator, name='generate')
-generator_generate = ModelMethod(method_=generate_method,
+generator_generate = ModelMethod(method_type=generate_method,
                                  name='Generator Generate')
 attribute_selection = ModelAttribute(attribute_name='models',
                                      name='Attribute Selection')
@@ -18,7 +19,7 @@ instanciate_optimizer = InstantiateModel(model_class=Optimizer,
 
 
 generate_method = MethodType(class_=Optimizer, name='optimize')
-optimization = ModelMethod(method_=generate_method, name='Optimization')
+optimization = ModelMethod(method_type=generate_method, name='Optimization')
 
 model_fetcher = ModelAttribute(attribute_name='model_to_optimize',
                                name='Model Fetcher')
@@ -63,16 +64,13 @@ input_values = {0: 5}
 demo_workflow_run = demo_workflow.run(input_values=input_values,
                                       verbose=True, name='Dev Objects')
 
-# Assert to_dict, dict_to_object, hashes, eqs
-# dict_ = demo_workflow_run.to_dict()
-# object_ = WorkflowRun.dict_to_object(dict_=dict_)
-#
-# assert hash(demo_workflow_run) == hash(object_)
-
-# Assert deserialization
-# demo_workflow_dict = demo_workflow.to_dict()
-# import json
-# demo_workflow_json = json.dumps(demo_workflow_dict)
-# dict_from_json = json.loads(demo_workflow_json)
-# deserialized_demo_workflow = wf.Workflow.dict_to_object(dict_from_json)
-# assert demo_workflow == deserialized_demo_workflow
+# Assert deserialization: a single to_dict feeds both the direct
+# round-trip and the json one
+demo_workflow_dict = demo_workflow.to_dict()
+
+deserialized_demo_workflow = Workflow.dict_to_object(demo_workflow_dict)
+assert demo_workflow == deserialized_demo_workflow
+
+demo_workflow_json = json.dumps(demo_workflow_dict)
+dict_from_json = json.loads(demo_workflow_json)
+assert demo_workflow == Workflow.dict_to_object(dict_from_json)
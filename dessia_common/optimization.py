@@ -88,6 +88,10 @@ class InstantiatingModelOptimizer(Optimizer):
         self.name = name
 
         self.number_parameters = len(self.optimization_bounds)
+        # Fixed parameters do not change between evaluations: build
+        # their part of the attributes dict once
+        self._fixed_attributes = {fp.attribute_name: fp.value
+                                  for fp in self.fixed_parameters}
     
     
     def instantiate_model(self, attributes_values):
@@ -97,8 +101,8 @@ class InstantiatingModelOptimizer(Optimizer):
         return [bound.dimensionless_to_value(dl_xi) for dl_xi, bound in zip(dl_vector, self.optimization_bounds)]
 
     def vector_to_attributes_values(self, vector:List[float]):
-        attributes = {fp.attribute_name: fp.value for fp in self.fixed_parameters}
-        
+        attributes = self._fixed_attributes.copy()
+
         for bound, xi in zip(self.optimization_bounds, vector):
             attributes[bound.attribute_name] = xi
         return attributes
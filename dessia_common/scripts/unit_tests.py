@@ -33,12 +33,14 @@ subobject_classname = full_classname(object_=EmbeddedSubobject,
                                      compute_for='class')
 enhanced_classname = full_classname(object_=EnhancedEmbeddedSubobject,
                                     compute_for='class')
-
-assert subobject_classname == 'dessia_common.forms.EmbeddedSubobject'
-assert enhanced_classname == 'dessia_common.forms.EnhancedEmbeddedSubobject'
 serialized_union = 'Union[{}, {}]'.format(subobject_classname,
                                           enhanced_classname)
 
+
+def test_full_classname():
+    assert subobject_classname == 'dessia_common.forms.EmbeddedSubobject'
+    assert enhanced_classname == 'dessia_common.forms.EnhancedEmbeddedSubobject'
+
 # Test jsonschema
 jsonschema = {
     'definitions': {},
@@ -162,39 +164,48 @@ jsonschema = {
     'whitelist_attributes': []
 }
 
-# Test deep_attr
-computed_jsonschema = standalone_object.jsonschema()
-try:
-    assert computed_jsonschema == jsonschema
-except AssertionError as err:
-    for key, value in computed_jsonschema['properties'].items():
-        if value != jsonschema['properties'][key]:
-            print('\n==', key, 'property failing ==\n')
-            for subkey, subvalue in value.items():
-                if subkey in jsonschema['properties'][key]:
-                    check_value = jsonschema['properties'][key][subkey]
-                    if subvalue != check_value:
-                        print('Problematic key :',  {subkey})
-                        print('Computed value : ', subvalue,
-                              '\nCheck value : ', check_value)
-            print('\n', value)
-            print('\n', jsonschema['properties'][key])
-            raise err
+def test_jsonschema():
+    computed_jsonschema = standalone_object.jsonschema()
+    try:
+        assert computed_jsonschema == jsonschema
+    except AssertionError as err:
+        for key, value in computed_jsonschema['properties'].items():
+            if value != jsonschema['properties'][key]:
+                print('\n==', key, 'property failing ==\n')
+                for subkey, subvalue in value.items():
+                    if subkey in jsonschema['properties'][key]:
+                        check_value = jsonschema['properties'][key][subkey]
+                        if subvalue != check_value:
+                            print('Problematic key :',  {subkey})
+                            print('Computed value : ', subvalue,
+                                  '\nCheck value : ', check_value)
+                print('\n', value)
+                print('\n', jsonschema['properties'][key])
+                raise err
+
+
+def test_deep_attr():
+    deepfloat = enhanced_deep_attr(obj=standalone_object,
+                                   sequence=['standalone_subobject',
+                                             'floatarg'])
+    assert deepfloat == 3.78
 
-deepfloat = enhanced_deep_attr(obj=standalone_object,
-                               sequence=['standalone_subobject', 'floatarg'])
-assert deepfloat == 3.78
+    deeplist = enhanced_deep_attr(obj=standalone_object,
+                                  sequence=['embedded_subobject',
+                                            'embedded_list', 2])
+    assert deeplist == 3
 
-deeplist = enhanced_deep_attr(obj=standalone_object,
-                              sequence=['embedded_subobject',
-                                        'embedded_list', 2])
-assert deeplist == 3
+    # deeperlist = enhanced_deep_attr(obj=standalone_object,
+    #                                 sequence=['subcla', 0,
+    #                                           'boolarg'])
+    # assert deeperlist
 
-# deeperlist = enhanced_deep_attr(obj=standalone_object,
-#                                 sequence=['subcla', 0,
-#                                           'boolarg'])
-# assert deeperlist
+    directattr = enhanced_deep_attr(obj=standalone_object,
+                                    sequence=['strarg'])
+    assert directattr == 'TestStr'
 
-directattr = enhanced_deep_attr(obj=standalone_object, sequence=['strarg'])
 
-assert directattr == 'TestStr'
+if __name__ == '__main__':
+    test_full_classname()
+    test_jsonschema()
+    test_deep_attr()
@@ -13,23 +13,31 @@ class InstanceOf(Generic[T]):
 
 
 class MethodType(Generic[T]):
+    __slots__ = ('class_', 'name')
+
     def __init__(self, class_: T, name: str):
         self.class_ = class_
         self.name = name
 
 
 class ClassMethodType(MethodType[T]):
+    __slots__ = ()
+
     def __init__(self, class_: T, name: str):
         MethodType.__init__(self, class_=class_, name=name)
 
 
 class AttributeType(Generic[T]):
+    __slots__ = ('class_', 'name')
+
     def __init__(self, class_: T, name: str):
         self.class_ = class_
         self.name = name
 
 
 class ClassAsttributeType(AttributeType[T]):
+    __slots__ = ()
+
     def __init__(self, class_: T, name: str):
         AttributeType.__init__(self, class_=class_, name=name)
 
@@ -41,24 +49,32 @@ RGBColor = Tuple[float, float, float]
 
 # Measures
 class Measure(float):
+    # No instance attributes beside the float value:
+    # empty slots keep instances as light as plain floats
+    __slots__ = ()
     units = ''
 
 
 class Distance(Measure):
+    __slots__ = ()
     units = 'm'
 
 
 class Force(Measure):
+    __slots__ = ()
     units = 'N'
 
 
 class Torque(Measure):
+    __slots__ = ()
     units = 'Nm'
 
 
 class Mass(Measure):
+    __slots__ = ()
     units = 'kg'
 
 
 class Stress(Measure):
+    __slots__ = ()
     units = 'Pa'
@@ -3,16 +3,17 @@ from typing import List
 
 def istep_from_value_on_list(list_:List[float], value:float,
                              extrapolate=False):
-    for ipoint, (point1, point2) in enumerate(zip(list_[:-1],
-                                                  list_[1:])):
-
-        point1_s, point2_s = sorted((point1, point2))
+    # Index loop: no slice copies and no per-pair sorted() allocation
+    for ipoint in range(len(list_) - 1):
+        point1_s = list_[ipoint]
+        point2_s = list_[ipoint + 1]
+        if point2_s < point1_s:
+            point1_s, point2_s = point2_s, point1_s
         if (point1_s <= value) and (value <= point2_s):
             alpha = (value-point1_s)/(point2_s-point1_s)
             if alpha < 0 or alpha > 1:
                 raise ValueError
             return ipoint + alpha
-    # values = [p for p in list_]
 
 
     if extrapolate:
@@ -10,11 +10,15 @@ import math
 from typing import List, Dict, Any
 import numpy as np
 import pandas as pd
-from dessia_common import DessiaObject, Parameter, is_bounded, Filter
+from dessia_common import DessiaObject, Parameter, Filter
 from scipy.optimize import minimize
 from pyDOE import lhs
 
 
+# Default parallel-plot color scale, shared by every display build
+PARALLEL_PLOT_RGBS = [[192, 11, 11], [14, 192, 11], [11, 11, 192]]
+
+
 class ParetoSettings(DessiaObject):
     """ 
     :param coeff_names: A dictionary containing the name of a variable as key and \
@@ -181,6 +185,21 @@ class Catalog(DessiaObject):
 
         self.generated_best_objectives = 0
 
+        # Lazy per-variable columns, filled on first use.
+        # The catalog array is never mutated once built, so the caches
+        # do not need invalidation
+        self._np_column_cache = {}
+        self._values_cache = {}
+        self._parameter_cache = {}
+        self._variable_index_cache = {}
+
+    def _np_column(self, variable: str) -> np.ndarray:
+        column = self._np_column_cache.get(variable)
+        if column is None:
+            column = np.asarray(self.get_values(variable), dtype=float)
+            self._np_column_cache[variable] = column
+        return column
+
     @classmethod
     def concatenate(cls, catalogs: List['Catalog'],
                     pareto_settings: ParetoSettings = None,
@@ -254,8 +273,6 @@ class Catalog(DessiaObject):
         fontsize = 12
         first_vars = self.variables[:2]
         values2d = [{key: val[key]} for key in first_vars for val in values]
-        rgbs = [[192, 11, 11], [14, 192, 11], [11, 11, 192]]
-
         tooltip = plot_data.Tooltip(to_disp_attribute_names=self.variables,
                                     name='Tooltip')
 
@@ -267,7 +284,8 @@ class Catalog(DessiaObject):
 
         parallelplot = plot_data.ParallelPlot(disposition='horizontal',
                                               to_disp_attribute_names=self.variables,
-                                              rgbs=rgbs, elements=values)
+                                              rgbs=PARALLEL_PLOT_RGBS,
+                                              elements=values)
         objects = [scatterplot, parallelplot]
         sizes = [plot_data.Window(width=560, height=300),
                  plot_data.Window(width=560, height=300)]
@@ -277,19 +295,21 @@ class Catalog(DessiaObject):
                                             name='Results plot')
         return multiplot
 
+    _FILTER_OPERATIONS = {'lte': np.less_equal, 'gte': np.greater_equal,
+                          'lt': np.less, 'gt': np.greater, 'eq': np.equal}
+
     def filter_(self, filters: List[Filter]):
-        def apply_filters(line):
-            bounded = True
-            i = 0
-            while bounded and i < len(filters):
-                filter_ = filters[i]
-                variable = filter_['attribute']
-                value = line[self.get_variable_index(variable)]
-                bounded = is_bounded(filter_, value)
-                i += 1
-            return bounded
-
-        filtered_array = list(filter(apply_filters, self.array))
+        # Each filter is one vectorized comparison on the cached
+        # column; lines are only touched once, through the final mask
+        mask = np.ones(len(self.array), dtype=bool)
+        for filter_ in filters:
+            operation = self._FILTER_OPERATIONS.get(filter_['operator'])
+            if operation is None:
+                continue
+            column = self._np_column(filter_['attribute'])
+            mask &= operation(column, filter_['bound'])
+        filtered_array = [line for line, bounded in zip(self.array, mask)
+                          if bounded]
         return filtered_array
 
     def export_csv(self, attribute_name: str, indices: List[int], file: str):
@@ -322,18 +342,32 @@ class Catalog(DessiaObject):
         """
         parameters = []
         for variable in variables:
-            values = self.get_values(variable)
-            parameters.append(Parameter(lower_bound=min(values),
-                                        upper_bound=max(values),
-                                        name=variable))
+            parameter = self._parameter_cache.get(variable)
+            if parameter is None:
+                # Both bounds come from the cached numpy column: two C
+                # reductions instead of two python passes over a list
+                column = self._np_column(variable)
+                parameter = Parameter(lower_bound=float(column.min()),
+                                      upper_bound=float(column.max()),
+                                      name=variable)
+                self._parameter_cache[variable] = parameter
+            parameters.append(parameter)
         return parameters
 
     def get_variable_index(self, name: str) -> int:
-        return self.variables.index(name)
+        index = self._variable_index_cache.get(name)
+        if index is None:
+            index = self.variables.index(name)
+            self._variable_index_cache[name] = index
+        return index
 
     def get_values(self, variable: str) -> List:
-        values = [self.get_value_by_name(line, variable)
-                  for line in self.array]
+        values = self._values_cache.get(variable)
+        if values is None:
+            # Resolve the column index once instead of once per line
+            j = self.get_variable_index(variable)
+            values = [line[j] for line in self.array]
+            self._values_cache[variable] = values
         return values
 
     def get_value_by_name(self, line: List, name: str) -> float:
@@ -367,16 +401,15 @@ class Catalog(DessiaObject):
         """
         params = list(pareto_settings.minimized_attributes.keys())
         pareto_parameters = self.parameters(params)
-        costs = np.zeros((len(self.array), len(pareto_parameters)))
-        for i, line in enumerate(self.array):
-            for j, parameter in enumerate(pareto_parameters):
-                if pareto_settings.minimized_attributes[parameter.name]:
-                    value = self.get_value_by_name(line, parameter.name)\
-                            - parameter.lower_bound
-                else:
-                    value = parameter.upper_bound\
-                            - self.get_value_by_name(line, parameter.name)
-                costs[(i, j)] = value
+        costs = np.empty((len(self.array), len(pareto_parameters)))
+        # One vectorized column operation per parameter instead of a
+        # python loop over every line of the catalog
+        for j, parameter in enumerate(pareto_parameters):
+            column = self._np_column(parameter.name)
+            if pareto_settings.minimized_attributes[parameter.name]:
+                costs[:, j] = column - parameter.lower_bound
+            else:
+                costs[:, j] = parameter.upper_bound - column
         return costs
 
     @classmethod
@@ -390,23 +423,31 @@ class Catalog(DessiaObject):
         pareto_settings = ParetoSettings({v: True for v in variables},
                                          enabled=True)
         objectives = []
+        lower = np.array([bounds[v][0] for v in variables])
+        upper = np.array([bounds[v][1] for v in variables])
+        # Draw whole batches and filter them with a vectorized mask
+        # instead of one rejection test per generated line
+        batch_size = int(end) + 1
         while len(array) <= end:
-            line = [(bounds[v][1]-bounds[v][0])*np.random.rand() + bounds[v][0]
-                    for v in variables]
-            if line[0]*line[1] >= threshold:
+            batch = lower + (upper - lower)*np.random.rand(batch_size,
+                                                           len(variables))
+            valid_lines = batch[batch[:, 0]*batch[:, 1] >= threshold]
+            for line in valid_lines.tolist():
                 array.append(line)
+                if len(array) > end:
+                    break
         return cls(array=array, variables=variables,
                    pareto_settings=pareto_settings, objectives=objectives,
                    choice_variables=variables, name=name)
 
     def handle_objective(self, objective: Objective) -> List[float]:
-        ratings = []
-        for line in self.array:
-            values = {variable: self.get_value_by_name(line, variable)
-                      for variable in objective.coefficients}
-            rating = objective.apply_individual(values)
-            ratings.append(rating)
-        return ratings
+        # Rating every line is a dot product of the coefficient vector
+        # with the corresponding columns of the catalog
+        coefficients = np.array(list(objective.coefficients.values()),
+                                dtype=float)
+        columns = np.array([self._np_column(variable)
+                            for variable in objective.coefficients])
+        return coefficients.dot(columns).tolist()
 
     def find_best_objective(self, values: Dict[str, float],
                             minimized: Dict[str, bool],
@@ -420,26 +461,29 @@ class Catalog(DessiaObject):
         pareto_settings = ParetoSettings(minimized_attributes=minimized)
         costs = self.build_costs(pareto_settings=pareto_settings)
         pareto_indices = pareto_frontier(costs=costs)
-        pareto_values = [{var: self.get_value_by_name(self.array[i], var)
-                          for var in variables}
-                         for i, is_efficient in enumerate(pareto_indices)
-                         if is_efficient]
+        # Rating a point is a dot product with the coefficient vector,
+        # so the pareto values are stacked once into a matrix and every
+        # optimizer iteration reduces to one matrix-vector product
+        columns = np.array([self._np_column(var) for var in names]).T
+        pareto_matrix = columns[pareto_indices]
+        values_vector = np.array([values[var] for var in names])
 
         def apply(x):
             objective = Objective.from_angles(angles=x,
                                               variables=names,
                                               directions=minimized)
-            best_on_pareto = min([objective.apply_individual(pareto_value)
-                                  for pareto_value in pareto_values])
-            rating = objective.apply_individual(values)
+            coefficients = np.array([objective.coefficients[var]
+                                     for var in names])
+            best_on_pareto = pareto_matrix.dot(coefficients).min()
+            rating = values_vector.dot(coefficients)
             delta = rating - best_on_pareto
             return delta
 
         i = 0
         success = False
         randomized_angles = lhs(len(values) - 1, 100)
-        available_angles = [[angle * 2 * math.pi for angle in angles]
-                            for angles in randomized_angles]
+        # One broadcasted multiply instead of a nested comprehension
+        available_angles = 2*math.pi*randomized_angles
         while i < len(available_angles) and not success:
             res = minimize(fun=apply, x0=randomized_angles[i], method="Powell")
             i += 1
@@ -557,11 +601,16 @@ def from_csv(filename: str, end: int = None, remove_duplicates: bool = False):
     array = np.genfromtxt(filename, dtype=None, delimiter=',',
                           names=True, encoding=None)
     variables = [v for v in array.dtype.fields.keys()]
+    if end is not None:
+        array = array[:end]
     lines = []
-    for i, line in enumerate(array):
-        if end is not None and i >= end:
-            break
-        if not remove_duplicates or (remove_duplicates
-                                     and line.tolist() not in lines):
-            lines.append(line.tolist())
+    seen = set()
+    for line in array:
+        # One C-level conversion to native Python scalars per row
+        values = line.tolist()
+        if remove_duplicates:
+            if values in seen:
+                continue
+            seen.add(values)
+        lines.append(values)
     return lines, variables
@@ -4,24 +4,27 @@
 
 """
 import os
-import inspect
+import sys
 import time
 import tempfile
 import json
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 import networkx as nx
+import numpy as npy
 from typing import List, Union, Type, Any, Dict, Tuple, get_type_hints
-from copy import deepcopy
+from functools import lru_cache
 from dessia_common.templates import workflow_template
 import itertools
 from dessia_common import DessiaObject, DisplayObject, Filter, \
     is_sequence, list_hash, serialize_typing, serialize, is_bounded, \
     get_python_class_from_class_name, deserialize, type_from_annotation,\
-    enhanced_deep_attr, deprecation_warning, JSONSCHEMA_HEADER,\
+    enhanced_deep_attr, deprecation_warning, jsonschema_header,\
     jsonschema_from_annotation, deserialize_argument, set_default_value,\
     prettyname, dict_to_object, serialize_dict, UntypedArgumentError,\
     recursive_type, recursive_instantiation, full_classname
-from dessia_common.vectored_objects import from_csv
+from dessia_common.vectored_objects import from_csv,\
+    PARALLEL_PLOT_RGBS
 from dessia_common.typings import JsonSerializable, Subclass, MethodType
 import warnings
 
@@ -43,7 +46,9 @@ class Variable(DessiaObject):
 
     def __init__(self, memorize: bool = False, name: str = ''):
         self.memorize = memorize
-        DessiaObject.__init__(self, name=name)
+        # Blocks wrapping the same methods create many variables with
+        # identical names: interning shares one string object per name
+        DessiaObject.__init__(self, name=sys.intern(name))
         self.position = None
 
     def to_dict(self):
@@ -321,7 +326,7 @@ class ClassMethod(Block):
 
         self.argument_names = [i.name for i in inputs]
 
-        output_name = 'method result of {}'.format(self.method_name)
+        output_name = f'method result of {self.method_name}'
         annotations = get_type_hints(method)
         if 'return' in annotations:
             type_ = type_from_annotation(annotations['return'],
@@ -392,7 +397,7 @@ class ModelMethod(Block):
         # Storing argument names
         self.argument_names = [i.name for i in inputs[1:]]
 
-        result_output_name = 'method result of {}'.format(self.method_name)
+        result_output_name = f'method result of {self.method_name}'
         annotations = get_type_hints(method)
         if 'return' in annotations:
             type_ = type_from_annotation(annotations['return'],
@@ -401,12 +406,12 @@ class ModelMethod(Block):
         else:
             return_output = Variable(name=result_output_name)
 
-        model_output_name = 'model at output {}'.format(self.method_name)
+        model_output_name = f'model at output {self.method_name}'
         model_output = TypedVariable(type_=self.model_class,
                                      name=model_output_name)
         outputs = [return_output, model_output]
         if name == '':
-            name = 'Model method: {}'.format(self.method_name)
+            name = f'Model method: {self.method_name}'
         Block.__init__(self, inputs, outputs, name=name)
 
     def equivalent_hash(self):
@@ -588,11 +593,17 @@ class ForEach(Block):
         values_workflow = {var2: values[var1]
                            for var1, var2 in zip(self.inputs,
                                                  self.workflow_block.inputs)}
-        output_values = []
-        for value in values_workflow[self.iter_input]:
-            values_workflow[self.iter_input] = value
-            output = self.workflow_block.evaluate(values_workflow)[0]
-            output_values.append(output)
+        iter_values = values_workflow[self.iter_input]
+
+        def evaluate_item(value):
+            item_values = dict(values_workflow)
+            item_values[self.iter_input] = value
+            return self.workflow_block.evaluate(item_values)[0]
+
+        # Iterations are independent; run them on a thread pool.
+        # executor.map preserves input order
+        with ThreadPoolExecutor() as executor:
+            output_values = list(executor.map(evaluate_item, iter_values))
         return [output_values]
 
 
@@ -600,7 +611,7 @@ class Unpacker(Block):
     def __init__(self, indices: List[int], name: str = ''):
         self.indices = indices
         inputs = [Variable(name='input_sequence')]
-        outputs = [Variable(name='output_{}'.format(i)) for i in indices]
+        outputs = [Variable(name=f'output_{i}') for i in indices]
 
         Block.__init__(self, inputs=inputs, outputs=outputs, name=name)
 
@@ -788,10 +799,9 @@ class MultiPlot(Display):
                                         elements=values2d,
                                         name='Scatter Plot')
 
-        rgbs = [[192, 11, 11], [14, 192, 11], [11, 11, 192]]
         parallelplot = plot_data.ParallelPlot(
             disposition='horizontal', to_disp_attribute_names=self.attributes,
-            rgbs=rgbs, elements=values
+            rgbs=PARALLEL_PLOT_RGBS, elements=values
         )
         objects = [scatterplot, parallelplot]
         sizes = [plot_data.Window(width=560, height=300),
@@ -890,7 +900,7 @@ class ModelAttribute(Block):
 class Sum(Block):
     def __init__(self, number_elements: int = 2, name: str = ''):
         self.number_elements = number_elements
-        inputs = [Variable(name='Sum element {}'.format(i + 1))
+        inputs = [Variable(name=f'Sum element {i + 1}')
                   for i in range(number_elements)]
         outputs = [Variable(name='Sum')]
         Block.__init__(self, inputs, outputs, name=name)
@@ -1117,13 +1127,22 @@ class Workflow(Block):
                 self.nonblock_variables.append(pipe.output_variable)
 
         self._utd_graph = False
+        self._variable_indices_cache = {}
+        self._layout_cache = None
+        self._topo_order = None
+        self._hash_cache = None
+        self._method_jsonschemas_cache = None
+        self._display_cache = None
+        self._layout_results = {}
 
         input_variables = []
 
+        # A variable has no ancestors iff it has no predecessors; plain
+        # adjacency dicts avoid building the networkx graph here
+        predecessors, _ = self._adjacency()
         for variable in self.variables:
             if (variable not in self.imposed_variable_values) and \
-                    (len(nx.ancestors(self.graph, variable)) == 0):
-                # !!! Why not just : if nx.ancestors(self.graph, variable) ?
+                    not predecessors[variable]:
                 # if not hasattr(variable, 'type_'):
                 #     msg = 'Workflow as an untyped input variable: {}'
                 #     raise WorkflowError(msg.format(variable.name))
@@ -1133,12 +1152,16 @@ class Workflow(Block):
         self.output = self.outputs[0]
 
     def _data_hash(self):
-        base_hash = len(self.blocks) \
-                    + 11 * len(self.pipes) \
-                    + sum(self.variable_indices(self.outputs[0]))
-        block_hash = int(sum([b.equivalent_hash() for b in self.blocks])
-                         % 10e5)
-        return base_hash + block_hash
+        # Blocks and pipes do not change once the workflow is built,
+        # and equality checks hash both sides every time
+        if self._hash_cache is None:
+            base_hash = len(self.blocks) \
+                        + 11 * len(self.pipes) \
+                        + sum(self.variable_indices(self.outputs[0]))
+            block_hash = int(sum([b.equivalent_hash() for b in self.blocks])
+                             % 10e5)
+            self._hash_cache = base_hash + block_hash
+        return self._hash_cache
 
     def _data_eq(self, other_workflow):
         # TODO: implement imposed_variable_values in equality
@@ -1190,13 +1213,22 @@ class Workflow(Block):
         return copied_workflow
 
     def _displays(self) -> List[JsonSerializable]:
-        display_object = DisplayObject(type_='workflow', data=self.to_dict())
-        displays = [display_object.to_dict()]
-        return displays
+        # The serialized payload is built once; only the enclosing list
+        # is fresh per call, since callers (WorkflowRun) append to it
+        if self._display_cache is None:
+            display_object = DisplayObject(type_='workflow',
+                                           data=self.to_dict())
+            self._display_cache = display_object.to_dict()
+        return [self._display_cache]
 
     @property
     def _method_jsonschemas(self):
-        jsonschemas = {'run': deepcopy(JSONSCHEMA_HEADER)}
+        # Inputs and blocks are frozen after __init__, so the schema is
+        # built once; consumers renaming entries (WorkflowRun) copy the
+        # outer dict first
+        if self._method_jsonschemas_cache is not None:
+            return self._method_jsonschemas_cache
+        jsonschemas = {'run': jsonschema_header()}
         properties_dict = jsonschemas['run']['properties']
         required_inputs = []
         for i, input_ in enumerate(self.inputs):
@@ -1233,6 +1265,7 @@ class Workflow(Block):
         }
         jsonschemas['run']['required'] = required_inputs
         jsonschemas['run']['method'] = True
+        self._method_jsonschemas_cache = jsonschemas
         return jsonschemas
 
     def to_dict(self):
@@ -1275,13 +1308,13 @@ class Workflow(Block):
 
         pipes = []
         for source, target in dict_['pipes']:
-            if type(source) == int:
+            if type(source) is int:
                 variable1 = nonblock_variables[source]
             else:
                 ib1, _, ip1 = source
                 variable1 = blocks[ib1].outputs[ip1]
 
-            if type(target) == int:
+            if type(target) is int:
                 variable2 = nonblock_variables[target]
             else:
                 ib2, _, ip2 = target
@@ -1297,7 +1330,7 @@ class Workflow(Block):
                            dict_['imposed_variable_values'])
             for variable_index, serialized_value in iterator:
                 value = deserialize(serialized_value)
-                if type(variable_index) == int:
+                if type(variable_index) is int:
                     variable = nonblock_variables[variable_index]
                 else:
                     iblock, side, iport = variable_index
@@ -1343,7 +1376,7 @@ class Workflow(Block):
         - int representin port side (0: input, 1: output)
         - Port index : int
         """
-        if type(index) == int:
+        if type(index) is int:
             variable = nonblock_variables[index]
         else:
             if not index[1]:
@@ -1355,11 +1388,57 @@ class Workflow(Block):
     def _get_graph(self):
         if not self._utd_graph:
             self._cached_graph = self._graph()
+            self._layout_cache = None
             self._utd_graph = True
         return self._cached_graph
 
     graph = property(_get_graph)
 
+    def _adjacency(self):
+        """
+        Builds predecessor and successor lists for every variable and
+        block in a single pass. Much lighter than the networkx graph,
+        which is kept only for plotting and path computations.
+        """
+        predecessors = {}
+        successors = {}
+        for node in itertools.chain(self.variables, self.blocks):
+            predecessors[node] = []
+            successors[node] = []
+        for block in self.blocks:
+            for input_parameter in block.inputs:
+                successors[input_parameter].append(block)
+                predecessors[block].append(input_parameter)
+            for output_parameter in block.outputs:
+                successors[block].append(output_parameter)
+                predecessors[output_parameter].append(block)
+        for pipe in self.pipes:
+            successors[pipe.input_variable].append(pipe.output_variable)
+            predecessors[pipe.output_variable].append(pipe.input_variable)
+        return predecessors, successors
+
+    def _get_topo_order(self):
+        if self._topo_order is None:
+            # Kahn's algorithm on the adjacency dicts: no networkx
+            # graph needed on the execution path
+            predecessors, successors = self._adjacency()
+            in_degrees = {node: len(preds)
+                          for node, preds in predecessors.items()}
+            stack = [node for node, degree in in_degrees.items()
+                     if degree == 0]
+            order = []
+            while stack:
+                node = stack.pop()
+                order.append(node)
+                for successor in successors[node]:
+                    in_degrees[successor] -= 1
+                    if not in_degrees[successor]:
+                        stack.append(successor)
+            if len(order) != len(in_degrees):
+                raise WorkflowError('Workflow graph contains a cycle')
+            self._topo_order = order
+        return self._topo_order
+
     def _graph(self):
         graph = nx.DiGraph()
         graph.add_nodes_from(self.variables)
@@ -1375,21 +1454,28 @@ class Workflow(Block):
         return graph
 
     def variable_indices(self, variable):
+        # Blocks and variables do not move once the workflow is built,
+        # so resolved indices are memoized instead of rescanning every
+        # block per call
+        indices = self._variable_indices_cache.get(variable)
+        if indices is not None:
+            return indices
+
         for iblock, block in enumerate(self.blocks):
             if variable in block.inputs:
-                ib1 = iblock
-                ti1 = 0
-                iv1 = block.inputs.index(variable)
-                return ib1, ti1, iv1
+                indices = (iblock, 0, block.inputs.index(variable))
+                self._variable_indices_cache[variable] = indices
+                return indices
             if variable in block.outputs:
-                ib1 = iblock
-                ti1 = 1
-                iv1 = block.outputs.index(variable)
-                return ib1, ti1, iv1
+                indices = (iblock, 1, block.outputs.index(variable))
+                self._variable_indices_cache[variable] = indices
+                return indices
 
         # Free variable not attached to block
         if variable in self.nonblock_variables:
-            return self.nonblock_variables.index(variable)
+            index = self.nonblock_variables.index(variable)
+            self._variable_indices_cache[variable] = index
+            return index
 
         msg = 'Some thing is wrong with variable {}'.format(variable.name)
         raise WorkflowError(msg)
@@ -1416,6 +1502,14 @@ class Workflow(Block):
 
     def layout(self, min_horizontal_spacing=300, min_vertical_spacing=200,
                max_height=800, max_length=1500):
+        # Path enumeration below can blow up on dense workflows and the
+        # layout is recomputed for every serialization, so results are
+        # memoized per spacing arguments
+        key = (min_horizontal_spacing, min_vertical_spacing,
+               max_height, max_length)
+        cached_coordinates = self._layout_results.get(key)
+        if cached_coordinates is not None:
+            return cached_coordinates
         coordinates = {}
         elements_by_distance = {}
         for element in self.blocks + self.nonblock_variables:
@@ -1454,6 +1548,7 @@ class Workflow(Block):
             for j, element in enumerate(elements_by_distance[distance]):
                 coordinates[element] = (i * horizontal_spacing,
                                         (j + 0.5) * vertical_spacing)
+        self._layout_results[key] = coordinates
         return coordinates
 
     def refresh_blocks_positions(self):
@@ -1464,8 +1559,11 @@ class Workflow(Block):
             nonblock.position = coordinates[nonblock]
 
     def plot_graph(self):
-
-        pos = nx.kamada_kawai_layout(self.graph)
+        # Kamada-Kawai is an O(V^3) solver: compute the layout once and
+        # reuse it for subsequent plots of the same graph
+        if self._layout_cache is None:
+            self._layout_cache = nx.kamada_kawai_layout(self.graph)
+        pos = self._layout_cache
         nx.draw_networkx_nodes(self.graph, pos, self.blocks,
                                node_shape='s', node_color='grey')
         nx.draw_networkx_nodes(self.graph, pos, self.variables, node_color='b')
@@ -1483,34 +1581,25 @@ class Workflow(Block):
     def run(self, input_values, verbose=False,
             progress_callback=None, name=None):
         log = ''
-        activated_items = {p: False for p in self.pipes}
-        activated_items.update({v: False for v in self.variables})
-        activated_items.update({b: False for b in self.blocks})
 
         values = {}
         variables_values = {}
-        # Imposed variables values activation
+        # Imposed variables values
         for variable, value in self.imposed_variable_values.items():
             # Type checking
             value_type_check(value, variable.type_)
             values[variable] = value
-            activated_items[variable] = True
 
-        # Input activation
+        # Inputs
         for index, variable in enumerate(self.inputs):
             if index in input_values:
-                value = input_values[index]
-                values[variable] = value
-                activated_items[variable] = True
+                values[variable] = input_values[index]
             elif hasattr(variable, 'default_value'):
                 values[variable] = variable.default_value
-                activated_items[variable] = True
             else:
                 msg = 'Value {} of index {} in inputs has no value'
                 raise ValueError(msg.format(variable.name, index))
 
-        something_activated = True
-
         start_time = time.time()
 
         log_msg = 'Starting workflow run at {}'
@@ -1521,57 +1610,51 @@ class Workflow(Block):
             print(log_line)
         progress = 0
 
-        while something_activated:
-            something_activated = False
-
-            for pipe in self.pipes:
-                if not activated_items[pipe]:
-                    if activated_items[pipe.input_variable]:
-                        activated_items[pipe] = True
-                        values[pipe.output_variable] = values[
-                            pipe.input_variable]
-                        activated_items[pipe.output_variable] = True
-                        something_activated = True
-
-            for block in self.blocks:
-                if not activated_items[block]:
-                    all_inputs_activated = True
-                    for function_input in block.inputs:
-                        if not activated_items[function_input]:
-                            all_inputs_activated = False
-                            break
-
-                    if all_inputs_activated:
-                        if verbose:
-                            log_line = 'Evaluating block {}'.format(block.name)
-                            log += log_line + '\n'
-                            if verbose:
-                                print(log_line)
-                        output_values = block.evaluate({i: values[i]
-                                                        for i in block.inputs})
-                        for input_ in block.inputs:
-                            if input_.memorize:
-                                indices = str(self.variable_indices(input_))
-                                variables_values[indices] = values[input_]
-                        # Updating progress
-                        if progress_callback is not None:
-                            progress += 1 / len(self.blocks)
-                            progress_callback(progress)
-
-                        # Unpacking result of evaluation
-                        output_items = zip(block.outputs, output_values)
-                        for output, output_value in output_items:
-                            if output.memorize:
-                                indices = str(self.variable_indices(output))
-                                variables_values[indices] = output_value
-                            values[output] = output_value
-                            activated_items[output] = True
-
-                        activated_items[block] = True
-                        something_activated = True
+        pipe_sources = {pipe.output_variable: pipe.input_variable
+                        for pipe in self.pipes}
+
+        # Single pass in topological order: when a node is reached, all
+        # its upstream values have already been computed
+        for node in self._get_topo_order():
+            if isinstance(node, Block):
+                block = node
+                all_inputs_activated = True
+                for function_input in block.inputs:
+                    if function_input not in values:
+                        all_inputs_activated = False
+                        break
+                if not all_inputs_activated:
+                    # Disconnected block, its inputs can never be computed
+                    continue
+
+                if verbose:
+                    log_line = f'Evaluating block {block.name}'
+                    log += log_line + '\n'
+                    print(log_line)
+                output_values = block.evaluate({i: values[i]
+                                                for i in block.inputs})
+                for input_ in block.inputs:
+                    if input_.memorize:
+                        indices = str(self.variable_indices(input_))
+                        variables_values[indices] = values[input_]
+                # Updating progress
+                if progress_callback is not None:
+                    progress += 1 / len(self.blocks)
+                    progress_callback(progress)
+
+                # Unpacking result of evaluation
+                for output, output_value in zip(block.outputs, output_values):
+                    if output.memorize:
+                        indices = str(self.variable_indices(output))
+                        variables_values[indices] = output_value
+                    values[output] = output_value
+            else:
+                source = pipe_sources.get(node)
+                if source is not None and source in values:
+                    values[node] = values[source]
 
         end_time = time.time()
-        log_line = 'Workflow terminated in {} s'.format(end_time - start_time)
+        log_line = f'Workflow terminated in {end_time - start_time} s'
 
         log += log_line + '\n'
         if verbose:
@@ -1634,7 +1717,7 @@ class Workflow(Block):
         edges = []
         for pipe in self.pipes:
             input_index = self.variable_indices(pipe.input_variable)
-            if type(input_index) == int:
+            if type(input_index) is int:
                 node1 = input_index
             else:
                 ib1, is1, ip1 = input_index
@@ -1645,7 +1728,7 @@ class Workflow(Block):
                 node1 = [ib1, ip1]
 
             output_index = self.variable_indices(pipe.output_variable)
-            if type(output_index) == int:
+            if type(output_index) is int:
                 node2 = output_index
             else:
                 ib2, is2, ip2 = output_index
@@ -1745,7 +1828,7 @@ class WorkflowBlock(Block):
         inputs = []
         for i, variable in enumerate(self.workflow.inputs):
             input_ = variable.copy()
-            input_.name = '{} - {}'.format(name, variable.name)
+            input_.name = f'{name} - {variable.name}'
             inputs.append(input_)
 
         outputs = [self.workflow.output.copy()]
@@ -1866,9 +1949,20 @@ class WorkflowRun(DessiaObject):
         if is_sequence(self.output_value):
             if not is_sequence(other_workflow_run.output_value):
                 return False
-            equal_output = all([v == other_v for v, other_v
-                                in zip(self.output_value,
-                                       other_workflow_run.output_value)])
+            output = self.output_value
+            other_output = other_workflow_run.output_value
+            number_values = len(output)
+            if number_values != len(other_output):
+                return False
+            equal_output = _numeric_sequences_eq(output, other_output)
+            if equal_output is None:
+                equal_output = True
+                for ivalue in range(number_values):
+                    value = output[ivalue]
+                    other_value = other_output[ivalue]
+                    if value is not other_value and value != other_value:
+                        equal_output = False
+                        break
         else:
             equal_output = self.output_value == other_workflow_run.output_value
         return self.workflow == other_workflow_run.workflow and equal_output
@@ -1972,44 +2066,86 @@ class WorkflowRun(DessiaObject):
 
     @property
     def _method_jsonschemas(self):
-        jsonschemas = self.workflow._method_jsonschemas
+        # Copy before renaming: the workflow caches and shares its dict
+        jsonschemas = dict(self.workflow._method_jsonschemas)
         jsonschemas['run_again'] = jsonschemas.pop('run')
         return jsonschemas
 
 
-def set_inputs_from_function(method, inputs=None):
+def _numeric_sequences_eq(seq1, seq2):
     """
-    
+    Fast path for comparing two long sequences of floats with numpy
+    instead of an element-wise python loop.
+    Returns True/False when both sequences are eligible,
+    None to tell the caller to fall back on the generic comparison.
     """
-    if inputs is None:
-        inputs = []
-    args_specs = inspect.getfullargspec(method)
-    nargs = len(args_specs.args) - 1
-
-    if args_specs.defaults is not None:
-        ndefault_args = len(args_specs.defaults)
-    else:
-        ndefault_args = 0
-
-    for iarg, argument in enumerate(args_specs.args[1:]):
+    if len(seq1) != len(seq2) or len(seq1) <= 32:
+        return None
+    # Only floats are eligible: casting large ints to float loses
+    # precision and could report unequal sequences as equal
+    for value in seq1:
+        if type(value) is not float:
+            return None
+    for value in seq2:
+        if type(value) is not float:
+            return None
+    try:
+        return bool(npy.array_equal(npy.asarray(seq1, dtype=float),
+                                    npy.asarray(seq2, dtype=float)))
+    except (TypeError, ValueError):
+        return None
+
+
+_NO_DEFAULT = object()
+
+
+@lru_cache(maxsize=None)
+def _method_input_specs(method):
+    """
+    Analyse the signature of a method or function once and cache the
+    result: a tuple of (argument name, type, default or sentinel).
+    Wrapping the same class or method in many blocks then skips the
+    costly reflection entirely.
+    """
+    code = method.__code__
+    argnames = code.co_varnames[1:code.co_argcount]
+    defaults = method.__defaults__ or ()
+    nargs = len(argnames)
+    ndefault_args = len(defaults)
+
+    annotations = get_type_hints(method)
+    specs = []
+    for iarg, argument in enumerate(argnames):
         if argument not in ['self', 'progress_callback']:
             try:
-                annotations = get_type_hints(method)
                 type_ = type_from_annotation(annotations[argument],
-                                                module=method.__module__)
+                                             module=method.__module__)
             except KeyError:
                 msg = 'Argument {} of method/function {} has no typing'
                 raise UntypedArgumentError(
                     msg.format(argument, method.__name__))
             if iarg >= nargs - ndefault_args:
-                default = args_specs.defaults[ndefault_args - nargs + iarg]
-                input_ = TypedVariableWithDefaultValue(type_=type_,
-                                                       default_value=default,
-                                                       name=argument)
-                inputs.append(input_)
-
+                default = defaults[ndefault_args - nargs + iarg]
             else:
-                inputs.append(TypedVariable(type_=type_, name=argument))
+                default = _NO_DEFAULT
+            specs.append((argument, type_, default))
+    return tuple(specs)
+
+
+def set_inputs_from_function(method, inputs=None):
+    """
+
+    """
+    if inputs is None:
+        inputs = []
+    for argument, type_, default in _method_input_specs(method):
+        if default is not _NO_DEFAULT:
+            input_ = TypedVariableWithDefaultValue(type_=type_,
+                                                   default_value=default,
+                                                   name=argument)
+            inputs.append(input_)
+        else:
+            inputs.append(TypedVariable(type_=type_, name=argument))
     return inputs
 
 